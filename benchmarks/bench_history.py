@@ -0,0 +1,86 @@
+"""Measure per-edit time and memory of the undo history against deep-copy snapshots.
+
+Usage: python benchmarks/bench_history.py [--edits 1000] [--entries 50]
+"""
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history import ResumeHistory
+
+
+def make_resume(entries):
+    entry = lambda i: {'position': f'Engineer {i}', 'company': f'Company {i}',
+                       'duration': '2019 - 2023', 'description': 'Built things. ' * 40}
+    return {
+        'personal': {'name': 'Test User', 'email': '', 'phone': '', 'location': '',
+                     'summary': 'Summary. ' * 50, 'linkedin': '', 'github': '', 'website': '',
+                     'profile_image': os.urandom(150 * 1024)},
+        'education': [{'degree': f'Degree {i}', 'institution': 'Uni', 'year': '2018', 'gpa': '3.5'}
+                      for i in range(entries)],
+        'experience': [entry(i) for i in range(entries)],
+        'skills': {'technical': [f'skill {i}' for i in range(entries)], 'soft': [], 'languages': []},
+        'projects': [], 'certifications': [], 'custom_sections': {},
+        'section_order': ['personal', 'education', 'experience', 'skills', 'projects', 'certifications']
+    }
+
+
+def random_edit(rng, history, i):
+    choice = rng.randrange(4)
+    if choice == 0:
+        history.append(('experience',), {'position': f'New {i}', 'company': 'Acme',
+                                         'duration': '2024', 'description': 'Did work.'})
+    elif choice == 1 and history.get(('education',)):
+        history.pop(('education',), rng.randrange(len(history.get(('education',)))))
+    elif choice == 2:
+        history.swap(('section_order',), 1, 2)
+    else:
+        history.set(('skills', 'technical'), history.get(('skills', 'technical')) + [f'new {i}'])
+
+
+class DeepCopyHistory(ResumeHistory):
+    """The naive alternative: store a full deep copy of the resume on every edit."""
+
+    def _commit(self, root):
+        self._undo.append(copy.deepcopy(self.current))
+        self._redo.clear()
+        self.current = root
+        return self.current
+
+
+def measure(history_cls, edits, entries, depth):
+    rng = random.Random(0)
+    history = history_cls(make_resume(entries), max_depth=depth)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for i in range(edits):
+        random_edit(rng, history, i)
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    # Retained memory is bounded by the history depth, so report it per stored entry
+    stored = min(edits, depth)
+    return elapsed / edits, retained / stored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edits", type=int, default=1000)
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=50)
+    args = parser.parse_args()
+
+    for label, cls in (("structural sharing", ResumeHistory), ("deep copy", DeepCopyHistory)):
+        per_edit, per_entry = measure(cls, args.edits, args.entries, args.depth)
+        print(f"{label + ':':<20} {per_edit * 1e6:8.1f} us/edit, {per_entry / 1024:8.1f} KiB per history entry")
+
+
+if __name__ == "__main__":
+    main()
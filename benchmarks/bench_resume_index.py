@@ -0,0 +1,122 @@
+"""Benchmark the resume search index on synthetic resumes.
+
+Usage: python benchmarks/bench_resume_index.py [--count 100000]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_index import ResumeIndex
+
+FIRST_NAMES = ["Ava", "Liam", "Noah", "Emma", "Sara", "Omar", "Ali", "Mei", "Ivan", "Zara", "Hana", "Leo"]
+LAST_NAMES = ["Khan", "Smith", "Garcia", "Chen", "Hussain", "Novak", "Patel", "Okafor", "Silva", "Berg"]
+TECH = ["Python", "Java", "Go", "Rust", "SQL", "React", "Docker", "Kubernetes", "AWS", "TensorFlow",
+        "Pandas", "Django", "Flask", "TypeScript", "Spark", "Terraform", "Linux", "GraphQL"]
+SOFT = ["Leadership", "Communication", "Mentoring", "Negotiation", "Teamwork", "Planning"]
+LANGUAGES = ["English", "Urdu", "Spanish", "German", "Mandarin", "French", "Arabic"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises",
+             "Hooli", "Pied Piper", "Cyberdyne", "Soylent"]
+POSITIONS = ["Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer",
+             "Backend Developer", "Frontend Developer", "ML Engineer", "QA Analyst"]
+WORDS = ["built", "scalable", "pipelines", "services", "designed", "migrated", "latency", "reduced",
+         "customers", "dashboards", "analytics", "platform", "deployed", "automated", "testing",
+         "architecture", "billing", "payments", "search", "recommendation", "mobile", "cloud"]
+
+
+def sentence(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n)).capitalize() + '.'
+
+
+def make_resume(rng):
+    return {
+        'personal': {
+            'name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            'email': '', 'phone': '', 'location': rng.choice(["Karachi", "Berlin", "Austin", "Lagos"]),
+            'summary': sentence(rng, 25), 'profile_image': None,
+            'linkedin': '', 'github': '', 'website': ''
+        },
+        'education': [{'degree': 'BSc Computer Science', 'institution': 'State University',
+                       'year': '2018', 'gpa': '3.5'}],
+        'experience': [
+            {'position': rng.choice(POSITIONS), 'company': rng.choice(COMPANIES),
+             'duration': '2019 - 2023', 'description': sentence(rng, 40)}
+            for _ in range(rng.randint(1, 4))
+        ],
+        'skills': {
+            'technical': rng.sample(TECH, 6),
+            'soft': rng.sample(SOFT, 2),
+            'languages': rng.sample(LANGUAGES, 2)
+        },
+        'projects': [{'name': 'Project ' + rng.choice(WORDS), 'duration': '2022',
+                      'description': sentence(rng, 20)}],
+        'certifications': [{'name': 'AWS Certified', 'issuer': 'Amazon', 'date': '2021'}],
+        'custom_sections': {},
+        'section_order': ['personal', 'education', 'experience', 'skills', 'projects', 'certifications']
+    }
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--updates", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        index = ResumeIndex(path)
+
+        start = time.perf_counter()
+        indexed = index.reindex((f"resume-{i}", make_resume(rng)) for i in range(args.count))
+        elapsed = time.perf_counter() - start
+        print(f"bulk reindex:       {indexed} resumes in {elapsed:.1f}s ({indexed / elapsed:,.0f}/s)")
+
+        start = time.perf_counter()
+        index.reindex()
+        print(f"rebuild from store: {time.perf_counter() - start:.1f}s")
+
+        timings = []
+        for _ in range(args.updates):
+            resume_id = f"resume-{rng.randrange(args.count)}"
+            t = time.perf_counter()
+            index.upsert(resume_id, make_resume(rng))
+            timings.append(time.perf_counter() - t)
+        print(f"incremental upsert: p50 {statistics.median(timings) * 1000:.2f} ms, "
+              f"p95 {percentile(timings, 0.95) * 1000:.2f} ms")
+
+        queries = [
+            ("skill", lambda: {'skill': rng.choice(TECH)}),
+            ("company", lambda: {'company': rng.choice(COMPANIES)}),
+            ("position", lambda: {'position': rng.choice(POSITIONS)}),
+            ("free text", lambda: {'text': f"{rng.choice(WORDS)} {rng.choice(WORDS)}"}),
+            ("combined", lambda: {'skill': rng.choice(TECH), 'company': rng.choice(COMPANIES),
+                                  'text': rng.choice(WORDS)}),
+        ]
+        for label, make_query in queries:
+            timings = []
+            for _ in range(args.queries):
+                kwargs = make_query()
+                t = time.perf_counter()
+                index.search(limit=20, **kwargs)
+                timings.append(time.perf_counter() - t)
+            print(f"search {label + ':':<10} p50 {statistics.median(timings) * 1000:.2f} ms, "
+                  f"p95 {percentile(timings, 0.95) * 1000:.2f} ms")
+
+        index.close()
+        print(f"index size:         {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+from collections import deque
+
+
+def _assoc(node, path, fn):
+    """Return a copy of `node` with fn applied at `path`.
+
+    Only the dicts/lists along the path are copied; every other branch (and
+    leaf values such as image bytes) is shared with the original.
+    """
+    if not path:
+        return fn(node)
+    key, rest = path[0], path[1:]
+    copy = dict(node) if isinstance(node, dict) else list(node)
+    copy[key] = _assoc(node[key], rest, fn)
+    return copy
+
+
+def _get(node, path):
+    for key in path:
+        node = node[key]
+    return node
+
+
+class ResumeHistory:
+    """Undo/redo history of resume data built from structurally shared snapshots.
+
+    Snapshots are never mutated: each edit builds a new root that copies only the
+    containers on the edited path, so an entry costs a few small dicts/lists rather
+    than a deep copy of the whole resume. Treat `current` as read-only and make
+    every change through the edit methods, which return the new current data.
+    """
+
+    def __init__(self, data, max_depth=50):
+        self.current = data
+        self.max_depth = max_depth
+        self._undo = deque(maxlen=max_depth)
+        self._redo = deque(maxlen=max_depth)
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    @property
+    def depth(self):
+        return len(self._undo)
+
+    def _commit(self, root):
+        if root is not self.current:
+            self._undo.append(self.current)
+            self._redo.clear()
+            self.current = root
+        return self.current
+
+    def get(self, path=()):
+        return _get(self.current, path)
+
+    def set(self, path, value):
+        """Replace the value at `path`; an empty path replaces the whole resume."""
+        old = _get(self.current, path)
+        if old is value or old == value:
+            return self.current
+        return self._commit(_assoc(self.current, tuple(path), lambda _: value))
+
+    def update(self, path, values):
+        """Merge `values` into the dict at `path`."""
+        old = _get(self.current, path)
+        if all(key in old and old[key] == value for key, value in values.items()):
+            return self.current
+        return self._commit(_assoc(self.current, tuple(path), lambda node: {**node, **values}))
+
+    def append(self, path, item):
+        return self._commit(_assoc(self.current, tuple(path), lambda node: node + [item]))
+
+    def pop(self, path, index):
+        return self._commit(_assoc(self.current, tuple(path),
+                                   lambda node: node[:index] + node[index + 1:]))
+
+    def swap(self, path, i, j):
+        def swapped(node):
+            node = list(node)
+            node[i], node[j] = node[j], node[i]
+            return node
+        return self._commit(_assoc(self.current, tuple(path), swapped))
+
+    def undo(self):
+        if self._undo:
+            self._redo.append(self.current)
+            self.current = self._undo.pop()
+        return self.current
+
+    def redo(self):
+        if self._redo:
+            self._undo.append(self.current)
+            self.current = self._redo.pop()
+        return self.current
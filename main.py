@@ -7,8 +7,13 @@ import time
 import json
 import io
 import os
+import re
 import tempfile
+import uuid
 from datetime import datetime
+from template_registry import TemplateRegistry
+from resume_index import ResumeIndex
+from history import ResumeHistory
 
 # Set page config
 st.set_page_config(
@@ -133,48 +138,18 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Enhanced template designs
-TEMPLATES = {
-    "Executive": {
-        "colors": {
-            "primary": "#1a365d",
-            "secondary": "#2c5282",
-            "text": "#2d3748",
-            "accent": "#90cdf4"
-        },
-        "font": "Helvetica",
-        "spacing": 1.2,
-        "borders": True,
-        "header_style": "gradient",
-        "section_style": "bordered"
-    },
-    "Ultra Modern": {
-        "colors": {
-            "primary": "#e53e3e",
-            "secondary": "#c53030",
-            "text": "#2d3748",
-            "accent": "#fed7d7"
-        },
-        "font": "Helvetica",
-        "spacing": 1.4,
-        "borders": False,
-        "header_style": "bold",
-        "section_style": "modern"
-    },
-    "Professional Plus": {
-        "colors": {
-            "primary": "#2b6cb0",
-            "secondary": "#2c5282",
-            "text": "#2d3748",
-            "accent": "#bee3f8"
-        },
-        "font": "Helvetica",
-        "spacing": 1.25,
-        "borders": True,
-        "header_style": "professional",
-        "section_style": "boxed"
-    }
-}
+# Template designs are loaded from the templates/ directory and shared by all sessions
+@st.cache_resource
+def get_template_registry():
+    return TemplateRegistry()
+
+# Full-text index of saved resumes, shared by all sessions
+@st.cache_resource
+def get_resume_index():
+    return ResumeIndex()
+
+# Number of undo steps kept per session
+HISTORY_DEPTH = 50
 
 # Initialize session state
 if 'resume_data' not in st.session_state:
@@ -210,13 +185,20 @@ if 'resume_data' not in st.session_state:
         ]
     }
 
+# resume_data is a read-only snapshot; all edits go through the history
+if 'history' not in st.session_state:
+    st.session_state.history = ResumeHistory(st.session_state.resume_data, max_depth=HISTORY_DEPTH)
+
 if 'template' not in st.session_state:
     st.session_state.template = "Executive"
 
+if 'resume_id' not in st.session_state:
+    st.session_state.resume_id = uuid.uuid4().hex
+
 class ResumePDF(FPDF):
     def __init__(self, template):
         super().__init__()
-        self.template = TEMPLATES[template]
+        self.template = template
         self.set_auto_page_break(auto=True, margin=15)
     
     def header(self):
@@ -233,17 +215,28 @@ class ResumePDF(FPDF):
         self.cell(0, 10, f'Generated on {datetime.now().strftime("%Y-%m-%d")} | Created by Riaz Hussain, Senior Student', 0, 0, 'C')
     
     def chapter_title(self, title):
-        self.set_font(self.template['font'], 'B', 14)
-        rgb = tuple(int(self.template["colors"]["primary"].lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
-        self.set_text_color(*rgb)
+        self.set_font(self.template.font, 'B', 14)
+        self.set_text_color(*self.template.primary)
         
-        if self.template["header_style"] == "gradient":
-            self.set_fill_color(*rgb)
+        if self.template.header_style == "gradient":
+            self.set_fill_color(*self.template.primary)
+            self.cell(0, 10, title, 0, 1, 'L', True)
+        elif self.template.section_style == "boxed":
+            self.set_fill_color(*self.template.accent)
             self.cell(0, 10, title, 0, 1, 'L', True)
         else:
             self.cell(0, 10, title, 0, 1, 'L')
         
-        if self.template["borders"]:
+        if self.template.section_style == "bordered":
+            # Vertical bar beside the title
+            self.set_fill_color(*self.template.secondary)
+            self.rect(self.l_margin - 3, self.get_y() - 9, 1.2, 8, 'F')
+        elif self.template.section_style == "modern":
+            # Short accent underline
+            self.set_fill_color(*self.template.accent)
+            self.rect(self.get_x(), self.get_y(), 40, 1.5, 'F')
+        
+        if self.template.borders:
             self.line(self.get_x(), self.get_y(), self.get_x() + 190, self.get_y())
         
         self.ln(4)
@@ -284,8 +277,10 @@ def save_profile_image(image):
     return None
 
 def create_pdf(data, template="Executive"):
-    pdf = ResumePDF(template)
-    template_settings = TEMPLATES[template]
+    template_settings = get_template_registry().get(template)
+    pdf = ResumePDF(template_settings)
+    line_height = template_settings.line_height
+    gap = template_settings.entry_gap
     pdf.add_page()
     
     # Personal Information
@@ -300,15 +295,12 @@ def create_pdf(data, template="Executive"):
             st.error(f"Error adding profile image: {str(e)}")
     
     # Name and Contact
-    pdf.set_font(template_settings['font'], 'B', 24)
-    rgb = tuple(int(template_settings["colors"]["primary"].lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
-    pdf.set_text_color(*rgb)
+    pdf.set_font(template_settings.font, 'B', 24)
+    pdf.set_text_color(*template_settings.primary)
     pdf.cell(0, 10, data['personal']['name'] or "Your Name", ln=True)
     
-    pdf.set_font(template_settings['font'], '', 11)
-    pdf.set_text_color(int(template_settings["colors"]["text"].lstrip('#')[0:2], 16),
-                      int(template_settings["colors"]["text"].lstrip('#')[2:4], 16),
-                      int(template_settings["colors"]["text"].lstrip('#')[4:6], 16))
+    pdf.set_font(template_settings.font, '', 11)
+    pdf.set_text_color(*template_settings.text)
     
     contact_info = []
     if data['personal']['email']:
@@ -318,7 +310,7 @@ def create_pdf(data, template="Executive"):
     if data['personal']['location']:
         contact_info.append(f"📍 {data['personal']['location']}")
     
-    pdf.cell(0, 6, ' | '.join(contact_info) if contact_info else "Contact Information", ln=True)
+    pdf.cell(0, line_height, ' | '.join(contact_info) if contact_info else "Contact Information", ln=True)
     
     # Social Links
     social_links = []
@@ -330,94 +322,94 @@ def create_pdf(data, template="Executive"):
         social_links.append(f"Website: {data['personal']['website']}")
     
     if social_links:
-        pdf.cell(0, 6, ' | '.join(social_links), ln=True)
+        pdf.cell(0, line_height, ' | '.join(social_links), ln=True)
     
     # Professional Summary
     if data['personal']['summary']:
-        pdf.ln(4)
-        pdf.set_font(template_settings['font'], 'B', 12)
-        pdf.cell(0, 6, 'Professional Summary', ln=True)
-        pdf.set_font(template_settings['font'], '', 11)
-        pdf.multi_cell(0, 6, data['personal']['summary'])
+        pdf.ln(gap * 2)
+        pdf.set_font(template_settings.font, 'B', 12)
+        pdf.cell(0, line_height, 'Professional Summary', ln=True)
+        pdf.set_font(template_settings.font, '', 11)
+        pdf.multi_cell(0, line_height, data['personal']['summary'])
 
     # Add sections based on order
     for section in data['section_order']:
-        pdf.ln(10)
+        pdf.ln(template_settings.section_gap)
         
         if section == 'education' and data['education']:
             pdf.chapter_title('Education')
             for edu in data['education']:
-                pdf.set_font(template_settings['font'], 'B', 11)
-                pdf.cell(0, 6, f"{edu['degree']} - {edu['institution']}", ln=True)
-                pdf.set_font(template_settings['font'], '', 10)
-                pdf.cell(0, 6, f"{edu['year']} | GPA: {edu['gpa']}", ln=True)
-                pdf.ln(2)
+                pdf.set_font(template_settings.font, 'B', 11)
+                pdf.cell(0, line_height, f"{edu['degree']} - {edu['institution']}", ln=True)
+                pdf.set_font(template_settings.font, '', 10)
+                pdf.cell(0, line_height, f"{edu['year']} | GPA: {edu['gpa']}", ln=True)
+                pdf.ln(gap)
         
         elif section == 'experience' and data['experience']:
             pdf.chapter_title('Professional Experience')
             for exp in data['experience']:
-                pdf.set_font(template_settings['font'], 'B', 11)
-                pdf.cell(0, 6, f"{exp['position']} at {exp['company']}", ln=True)
-                pdf.set_font(template_settings['font'], 'I', 10)
-                pdf.cell(0, 6, exp['duration'], ln=True)
-                pdf.set_font(template_settings['font'], '', 10)
-                pdf.multi_cell(0, 6, exp['description'])
-                pdf.ln(2)
+                pdf.set_font(template_settings.font, 'B', 11)
+                pdf.cell(0, line_height, f"{exp['position']} at {exp['company']}", ln=True)
+                pdf.set_font(template_settings.font, 'I', 10)
+                pdf.cell(0, line_height, exp['duration'], ln=True)
+                pdf.set_font(template_settings.font, '', 10)
+                pdf.multi_cell(0, line_height, exp['description'])
+                pdf.ln(gap)
         
         elif section == 'skills' and (data['skills']['technical'] or data['skills']['soft'] or data['skills']['languages']):
             pdf.chapter_title('Skills')
             
             if data['skills']['technical']:
-                pdf.set_font(template_settings['font'], 'B', 11)
-                pdf.cell(0, 6, 'Technical Skills', ln=True)
-                pdf.set_font(template_settings['font'], '', 10)
-                pdf.multi_cell(0, 6, ', '.join(data['skills']['technical']))
-                pdf.ln(2)
+                pdf.set_font(template_settings.font, 'B', 11)
+                pdf.cell(0, line_height, 'Technical Skills', ln=True)
+                pdf.set_font(template_settings.font, '', 10)
+                pdf.multi_cell(0, line_height, ', '.join(data['skills']['technical']))
+                pdf.ln(gap)
             
             if data['skills']['soft']:
-                pdf.set_font(template_settings['font'], 'B', 11)
-                pdf.cell(0, 6, 'Soft Skills', ln=True)
-                pdf.set_font(template_settings['font'], '', 10)
-                pdf.multi_cell(0, 6, ', '.join(data['skills']['soft']))
-                pdf.ln(2)
+                pdf.set_font(template_settings.font, 'B', 11)
+                pdf.cell(0, line_height, 'Soft Skills', ln=True)
+                pdf.set_font(template_settings.font, '', 10)
+                pdf.multi_cell(0, line_height, ', '.join(data['skills']['soft']))
+                pdf.ln(gap)
             
             if data['skills']['languages']:
-                pdf.set_font(template_settings['font'], 'B', 11)
-                pdf.cell(0, 6, 'Languages', ln=True)
-                pdf.set_font(template_settings['font'], '', 10)
-                pdf.multi_cell(0, 6, ', '.join(data['skills']['languages']))
+                pdf.set_font(template_settings.font, 'B', 11)
+                pdf.cell(0, line_height, 'Languages', ln=True)
+                pdf.set_font(template_settings.font, '', 10)
+                pdf.multi_cell(0, line_height, ', '.join(data['skills']['languages']))
         
         elif section == 'projects' and data['projects']:
             pdf.chapter_title('Projects')
             for project in data['projects']:
-                pdf.set_font(template_settings['font'], 'B', 11)
-                pdf.cell(0, 6, project['name'], ln=True)
-                pdf.set_font(template_settings['font'], 'I', 10)
-                pdf.cell(0, 6, project['duration'], ln=True)
-                pdf.set_font(template_settings['font'], '', 10)
-                pdf.multi_cell(0, 6, project['description'])
-                pdf.ln(2)
+                pdf.set_font(template_settings.font, 'B', 11)
+                pdf.cell(0, line_height, project['name'], ln=True)
+                pdf.set_font(template_settings.font, 'I', 10)
+                pdf.cell(0, line_height, project['duration'], ln=True)
+                pdf.set_font(template_settings.font, '', 10)
+                pdf.multi_cell(0, line_height, project['description'])
+                pdf.ln(gap)
         
         elif section == 'certifications' and data['certifications']:
             pdf.chapter_title('Certifications')
             for cert in data['certifications']:
-                pdf.set_font(template_settings['font'], 'B', 11)
-                pdf.cell(0, 6, cert['name'], ln=True)
-                pdf.set_font(template_settings['font'], '', 10)
-                pdf.cell(0, 6, f"Issuer: {cert['issuer']} | Date: {cert['date']}", ln=True)
-                pdf.ln(2)
+                pdf.set_font(template_settings.font, 'B', 11)
+                pdf.cell(0, line_height, cert['name'], ln=True)
+                pdf.set_font(template_settings.font, '', 10)
+                pdf.cell(0, line_height, f"Issuer: {cert['issuer']} | Date: {cert['date']}", ln=True)
+                pdf.ln(gap)
         
         elif section in data['custom_sections'] and data['custom_sections'][section]:
             pdf.chapter_title(section)
             for entry in data['custom_sections'][section]:
-                pdf.set_font(template_settings['font'], 'B', 11)
-                pdf.cell(0, 6, entry['title'], ln=True)
+                pdf.set_font(template_settings.font, 'B', 11)
+                pdf.cell(0, line_height, entry['title'], ln=True)
                 if entry.get('date'):
-                    pdf.set_font(template_settings['font'], 'I', 10)
-                    pdf.cell(0, 6, entry['date'], ln=True)
-                pdf.set_font(template_settings['font'], '', 10)
-                pdf.multi_cell(0, 6, entry['description'])
-                pdf.ln(2)
+                    pdf.set_font(template_settings.font, 'I', 10)
+                    pdf.cell(0, line_height, entry['date'], ln=True)
+                pdf.set_font(template_settings.font, '', 10)
+                pdf.multi_cell(0, line_height, entry['description'])
+                pdf.ln(gap)
     
     # Use a temporary file to generate PDF and read as bytes
     with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
@@ -445,14 +437,20 @@ def render_personal_info():
         
         uploaded_file = st.file_uploader("Profile Picture", type=['jpg', 'jpeg', 'png'])
         if uploaded_file:
-            st.session_state.resume_data['personal']['profile_image'] = save_profile_image(uploaded_file)
+            # The uploader keeps its file across reruns; record each upload only once
+            # so undoing it isn't immediately re-applied
+            if st.session_state.get('profile_image_upload') != uploaded_file.file_id:
+                st.session_state.profile_image_upload = uploaded_file.file_id
+                st.session_state.resume_data = st.session_state.history.set(
+                    ('personal', 'profile_image'), save_profile_image(uploaded_file)
+                )
             if st.session_state.resume_data['personal']['profile_image']:
                 st.image(st.session_state.resume_data['personal']['profile_image'], width=150, output_format='PNG')
     
     summary = st.text_area("Professional Summary", st.session_state.resume_data['personal']['summary'])
     
     if st.button("Save Personal Information"):
-        st.session_state.resume_data['personal'].update({
+        st.session_state.resume_data = st.session_state.history.update(('personal',), {
             'name': name,
             'email': email,
             'phone': phone,
@@ -478,7 +476,7 @@ def render_education():
             gpa = st.text_input("GPA")
         
         if st.form_submit_button("Add Education"):
-            st.session_state.resume_data['education'].append({
+            st.session_state.resume_data = st.session_state.history.append(('education',), {
                 'degree': degree,
                 'institution': institution,
                 'year': year,
@@ -495,7 +493,7 @@ def render_education():
                 st.write(f"Year: {edu['year']}")
                 st.write(f"GPA: {edu['gpa']}")
                 if st.button("Remove", key=f"del_edu_{i}"):
-                    st.session_state.resume_data['education'].pop(i)
+                    st.session_state.resume_data = st.session_state.history.pop(('education',), i)
                     st.rerun()
 
 def render_experience():
@@ -509,7 +507,7 @@ def render_experience():
         description = st.text_area("Job Description")
         
         if st.form_submit_button("Add Experience"):
-            st.session_state.resume_data['experience'].append({
+            st.session_state.resume_data = st.session_state.history.append(('experience',), {
                 'position': position,
                 'company': company,
                 'duration': duration,
@@ -526,7 +524,7 @@ def render_experience():
                 st.write(f"Duration: {exp['duration']}")
                 st.write(f"Description: {exp['description']}")
                 if st.button("Remove", key=f"del_exp_{i}"):
-                    st.session_state.resume_data['experience'].pop(i)
+                    st.session_state.resume_data = st.session_state.history.pop(('experience',), i)
                     st.rerun()
 
 def render_skills():
@@ -541,9 +539,9 @@ def render_skills():
             value='\n'.join(st.session_state.resume_data['skills']['technical'])
         )
         if st.button("Save Technical Skills"):
-            st.session_state.resume_data['skills']['technical'] = [
+            st.session_state.resume_data = st.session_state.history.set(('skills', 'technical'), [
                 skill.strip() for skill in tech_skills.split('\n') if skill.strip()
-            ]
+            ])
             st.success("Technical skills saved!")
     
     with tabs[1]:
@@ -552,9 +550,9 @@ def render_skills():
             value='\n'.join(st.session_state.resume_data['skills']['soft'])
         )
         if st.button("Save Soft Skills"):
-            st.session_state.resume_data['skills']['soft'] = [
+            st.session_state.resume_data = st.session_state.history.set(('skills', 'soft'), [
                 skill.strip() for skill in soft_skills.split('\n') if skill.strip()
-            ]
+            ])
             st.success("Soft skills saved!")
     
     with tabs[2]:
@@ -563,9 +561,9 @@ def render_skills():
             value='\n'.join(st.session_state.resume_data['skills']['languages'])
         )
         if st.button("Save Languages"):
-            st.session_state.resume_data['skills']['languages'] = [
+            st.session_state.resume_data = st.session_state.history.set(('skills', 'languages'), [
                 lang.strip() for lang in languages.split('\n') if lang.strip()
-            ]
+            ])
             st.success("Languages saved!")
 
 def render_projects():
@@ -578,7 +576,7 @@ def render_projects():
         description = st.text_area("Project Description")
         
         if st.form_submit_button("Add Project"):
-            st.session_state.resume_data['projects'].append({
+            st.session_state.resume_data = st.session_state.history.append(('projects',), {
                 'name': name,
                 'duration': duration,
                 'description': description
@@ -594,7 +592,7 @@ def render_projects():
                 st.write(f"Duration: {project['duration']}")
                 st.write(f"Description: {project['description']}")
                 if st.button("Remove", key=f"del_proj_{i}"):
-                    st.session_state.resume_data['projects'].pop(i)
+                    st.session_state.resume_data = st.session_state.history.pop(('projects',), i)
                     st.rerun()
 
 def render_certifications():
@@ -607,7 +605,7 @@ def render_certifications():
         date = st.text_input("Date Obtained")
         
         if st.form_submit_button("Add Certification"):
-            st.session_state.resume_data['certifications'].append({
+            st.session_state.resume_data = st.session_state.history.append(('certifications',), {
                 'name': name,
                 'issuer': issuer,
                 'date': date
@@ -623,7 +621,7 @@ def render_certifications():
                 st.write(f"Issuer: {cert['issuer']}")
                 st.write(f"Date: {cert['date']}")
                 if st.button("Remove", key=f"del_cert_{i}"):
-                    st.session_state.resume_data['certifications'].pop(i)
+                    st.session_state.resume_data = st.session_state.history.pop(('certifications',), i)
                     st.rerun()
 
 def render_section_order():
@@ -637,11 +635,11 @@ def render_section_order():
             st.write(sections[i])
         with col2:
             if i > 0 and st.button("↑", key=f"up_{i}"):
-                sections[i], sections[i-1] = sections[i-1], sections[i]
+                st.session_state.resume_data = st.session_state.history.swap(('section_order',), i, i-1)
                 st.rerun()
         with col3:
             if i < len(sections)-1 and st.button("↓", key=f"down_{i}"):
-                sections[i], sections[i+1] = sections[i+1], sections[i]
+                st.session_state.resume_data = st.session_state.history.swap(('section_order',), i, i+1)
                 st.rerun()
 
 def render_preview_download():
@@ -659,12 +657,21 @@ def render_preview_download():
             st.error(f"Error generating PDF: {str(e)}")
     
     if st.button("Save Resume Data"):
+        # Indexing is best effort; a broken index must not block the download
         try:
-            resume_data = st.session_state.resume_data.copy()
+            get_resume_index().upsert(st.session_state.resume_id, st.session_state.resume_data)
+        except Exception as e:
+            st.warning(f"Resume could not be added to the search index: {str(e)}")
+        try:
+            resume_data = st.session_state.resume_data
             if resume_data['personal']['profile_image']:
-                resume_data['personal']['profile_image'] = base64.b64encode(
-                    resume_data['personal']['profile_image']
-                ).decode('utf-8')
+                # Build a new dict: history snapshots share 'personal' and must not be mutated
+                resume_data = {**resume_data, 'personal': {
+                    **resume_data['personal'],
+                    'profile_image': base64.b64encode(
+                        resume_data['personal']['profile_image']
+                    ).decode('utf-8')
+                }}
             data_str = json.dumps(resume_data, indent=2)
             b64_data = base64.b64encode(data_str.encode()).decode()
             href = f'<a href="data:application/json;base64,{b64_data}" download="resume_data.json" class="download-button">💾 Download Resume Data</a>'
@@ -673,6 +680,69 @@ def render_preview_download():
         except Exception as e:
             st.error(f"Error saving data: {str(e)}")
 
+def escape_markdown(text):
+    return re.sub(r"([\\`*_{}\[\]()<>#+\-.!|~:$])", r"\\\1", text)
+
+def render_search():
+    st.markdown('<div class="form-section">', unsafe_allow_html=True)
+    st.subheader("🔍 Search Resumes")
+    
+    try:
+        index = get_resume_index()
+    except Exception as e:
+        st.error(f"Error opening search index: {str(e)}")
+        return
+    
+    text = st.text_input("Search text")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        skill = st.text_input("Skill")
+    with col2:
+        company = st.text_input("Company")
+    with col3:
+        position = st.text_input("Position")
+    
+    if text or skill or company or position:
+        try:
+            results = index.search(text, skill=skill, company=company, position=position)
+        except Exception as e:
+            st.error(f"Error searching resumes: {str(e)}")
+            results = []
+        st.markdown(f"### {len(results)} matching resumes")
+        for result in results:
+            # Names and snippets come from other resumes: show them as plain text
+            name = escape_markdown(result['name']) if result['name'] else 'Unnamed'
+            with st.expander(f"{name} (updated {result['updated_at']})"):
+                st.text(result['snippet'])
+                if st.button("Load into editor", key=f"load_{result['resume_id']}"):
+                    data = index.get(result['resume_id'])
+                    data['personal']['profile_image'] = None
+                    # A loaded resume is a different document, so it gets a fresh history
+                    st.session_state.history = ResumeHistory(data, max_depth=HISTORY_DEPTH)
+                    st.session_state.resume_data = data
+                    st.session_state.resume_id = result['resume_id']
+                    st.success("Resume loaded!")
+    
+    try:
+        st.caption(f"{index.count()} resumes indexed")
+        if st.button("Rebuild Search Index"):
+            st.success(f"Reindexed {index.reindex()} resumes!")
+    except Exception as e:
+        st.error(f"Error updating search index: {str(e)}")
+
+def render_history_controls():
+    st.header("↩️ History")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Undo", disabled=not st.session_state.history.can_undo):
+            st.session_state.resume_data = st.session_state.history.undo()
+            st.rerun()
+    with col2:
+        if st.button("Redo", disabled=not st.session_state.history.can_redo):
+            st.session_state.resume_data = st.session_state.history.redo()
+            st.rerun()
+    st.caption(f"{st.session_state.history.depth}/{HISTORY_DEPTH} undo steps")
+
 def main():
     st.markdown("""
     <div class="main-header">
@@ -687,14 +757,27 @@ def main():
         section = st.radio(
             "Choose section to edit:",
             ["Personal Information", "Education", "Experience", "Skills",
-             "Projects", "Certifications", "Section Order", "Preview & Download"]
+             "Projects", "Certifications", "Section Order", "Preview & Download",
+             "Search Resumes"]
         )
         
+        # Filled in after the page renders so it reflects this run's edits
+        history_controls = st.container()
+        
         st.header("🎨 Template")
+        registry = get_template_registry()
+        template_names = registry.names()
+        if not template_names:
+            st.error(f"No valid templates found in {registry.directory}")
+            st.stop()
         st.session_state.template = st.selectbox(
             "Choose template:",
-            list(TEMPLATES.keys())
+            template_names,
+            index=template_names.index(st.session_state.template)
+            if st.session_state.template in template_names else 0
         )
+        for error in registry.errors.values():
+            st.warning(f"Template error: {error}")
     
     if section == "Personal Information":
         render_personal_info()
@@ -712,6 +795,11 @@ def main():
         render_section_order()
     elif section == "Preview & Download":
         render_preview_download()
+    elif section == "Search Resumes":
+        render_search()
+    
+    with history_controls:
+        render_history_controls()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
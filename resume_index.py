@@ -0,0 +1,234 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+DEFAULT_INDEX_PATH = os.environ.get(
+    "RESUME_INDEX_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "resume_index.db")
+)
+
+# bm25 weights for the FTS columns name, skills, companies, positions, body
+FTS_WEIGHTS = (4.0, 3.0, 2.0, 2.0, 1.0)
+
+# Written between skills/companies/positions so a phrase can't match across two of
+# them. It is a token character for FTS5 but never appears in a parsed query.
+FIELD_SEPARATOR = "\u2063"
+
+# '+' and '#' are kept so "C++", "C#" and "C" stay distinct tokens
+FTS_TOKENIZE = f"unicode61 remove_diacritics 2 tokenchars '+#{FIELD_SEPARATOR}'"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY,
+    resume_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS resume_fts USING fts5(
+    name, skills, companies, positions, body,
+    tokenize = "{FTS_TOKENIZE}"
+);
+"""
+INSERT_FTS = (
+    "INSERT INTO resume_fts (rowid, name, skills, companies, positions, body) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# Must split text the same way as FTS_TOKENIZE
+TOKEN = re.compile(r"[\w+#]+", re.UNICODE)
+
+
+def strip_resume(data):
+    """Copy of the resume without the profile image, which is never indexed or stored."""
+    personal = dict(data.get('personal', {}))
+    personal.pop('profile_image', None)
+    return {**data, 'personal': personal}
+
+
+def resume_document(data):
+    """Flatten the resume data model into the FTS columns."""
+    personal = data.get('personal', {})
+    skills = data.get('skills', {})
+    experience = data.get('experience', [])
+
+    body = [personal.get('summary', ''), personal.get('location', '')]
+    for edu in data.get('education', []):
+        body += [edu.get('degree', ''), edu.get('institution', '')]
+    for exp in experience:
+        body.append(exp.get('description', ''))
+    for project in data.get('projects', []):
+        body += [project.get('name', ''), project.get('description', '')]
+    for cert in data.get('certifications', []):
+        body += [cert.get('name', ''), cert.get('issuer', '')]
+    for section, entries in data.get('custom_sections', {}).items():
+        body.append(section)
+        for entry in entries:
+            body += [entry.get('title', ''), entry.get('description', '')]
+
+    separator = f"\n{FIELD_SEPARATOR}\n"
+    return (
+        personal.get('name', ''),
+        separator.join(skills.get('technical', []) + skills.get('soft', []) + skills.get('languages', [])),
+        separator.join(exp.get('company', '') for exp in experience),
+        separator.join(exp.get('position', '') for exp in experience),
+        '\n'.join(part for part in body if part),
+    )
+
+
+def phrase(text):
+    """Turn user input into a quoted FTS5 phrase so operators and punctuation are never parsed."""
+    tokens = TOKEN.findall(text)
+    return '"' + ' '.join(tokens) + '"' if tokens else None
+
+
+def build_query(text="", skill="", company="", position=""):
+    parts = []
+    # Free text: every word must match somewhere, the last one as a prefix unless
+    # it is a single character ("C" as a prefix would match almost everything)
+    tokens = TOKEN.findall(text)
+    for i, token in enumerate(tokens):
+        parts.append(f'"{token}"*' if i == len(tokens) - 1 and len(token) > 1 else f'"{token}"')
+    # Skill/company/position filters match a phrase within a single entry
+    for column, value in (("skills", skill), ("companies", company), ("positions", position)):
+        value = phrase(value)
+        if value:
+            parts.append(f"{column} : {value}")
+    return ' AND '.join(parts)
+
+
+class ResumeIndex:
+    """Embedded SQLite FTS5 index over saved resumes.
+
+    One instance can be shared across sessions; the connection is guarded by a lock.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(SCHEMA)
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'resume_fts'"
+        ).fetchone()
+        if row is None:
+            self._conn.executescript(FTS_SCHEMA)
+        elif FTS_TOKENIZE not in row[0]:
+            # Index built with an older tokenizer
+            self.reindex()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def _write(self, resume_id, data, updated_at):
+        data = strip_resume(data)
+        document = resume_document(data)
+        self._conn.execute(
+            "INSERT INTO resumes (resume_id, name, updated_at, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(resume_id) DO UPDATE SET name = excluded.name, "
+            "updated_at = excluded.updated_at, data = excluded.data",
+            (resume_id, document[0], updated_at, json.dumps(data))
+        )
+        row = self._conn.execute(
+            "SELECT id FROM resumes WHERE resume_id = ?", (resume_id,)
+        ).fetchone()
+        self._conn.execute("DELETE FROM resume_fts WHERE rowid = ?", (row[0],))
+        self._conn.execute(INSERT_FTS, (row[0],) + document)
+
+    def upsert(self, resume_id, data):
+        """Add or replace a single resume; only its own index rows are touched."""
+        with self._lock, self._conn:
+            self._write(resume_id, data, datetime.now().isoformat(timespec='seconds'))
+
+    def delete(self, resume_id):
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id FROM resumes WHERE resume_id = ?", (resume_id,)
+            ).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM resumes WHERE id = ?", (row[0],))
+                self._conn.execute("DELETE FROM resume_fts WHERE rowid = ?", (row[0],))
+
+    def reindex(self, resumes=None):
+        """Rebuild the index in one transaction.
+
+        With `resumes` (an iterable of (resume_id, data) pairs with unique ids) the
+        stored resumes are replaced; without it the full-text index is rebuilt from
+        the stored data. The FTS table is recreated, so tokenizer changes take effect.
+        Returns the number of resumes indexed.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DROP TABLE IF EXISTS resume_fts")
+            self._conn.execute(FTS_SCHEMA)
+            if resumes is not None:
+                self._conn.execute("DELETE FROM resumes")
+                updated_at = datetime.now().isoformat(timespec='seconds')
+                for resume_id, data in resumes:
+                    data = strip_resume(data)
+                    document = resume_document(data)
+                    cursor = self._conn.execute(
+                        "INSERT INTO resumes (resume_id, name, updated_at, data) VALUES (?, ?, ?, ?)",
+                        (resume_id, document[0], updated_at, json.dumps(data))
+                    )
+                    self._conn.execute(INSERT_FTS, (cursor.lastrowid,) + document)
+            else:
+                rows = self._conn.execute("SELECT id, data FROM resumes").fetchall()
+                self._conn.executemany(
+                    INSERT_FTS,
+                    ((row_id,) + resume_document(json.loads(data)) for row_id, data in rows)
+                )
+            self._conn.execute("INSERT INTO resume_fts (resume_fts) VALUES ('optimize')")
+            return self._conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def search(self, text="", skill="", company="", position="", limit=20):
+        """Ranked search; every given filter must match. Best matches first."""
+        query = build_query(text, skill, company, position)
+        if not query:
+            return []
+        weights = ', '.join(str(w) for w in FTS_WEIGHTS)
+        with self._lock:
+            # Rank first, then build snippets for the top rows only; snippet() in the
+            # ranking query would run for every match before the LIMIT applies.
+            top = self._conn.execute(
+                f"SELECT rowid, bm25(resume_fts, {weights}) AS score FROM resume_fts "
+                "WHERE resume_fts MATCH ? ORDER BY score LIMIT ?",
+                (query, limit)
+            ).fetchall()
+            if not top:
+                return []
+            placeholders = ', '.join('?' * len(top))
+            details = {
+                row[0]: row[1:] for row in self._conn.execute(
+                    "SELECT resume_fts.rowid, r.resume_id, r.name, r.updated_at, "
+                    "snippet(resume_fts, -1, '[', ']', '…', 12) "
+                    "FROM resume_fts JOIN resumes r ON r.id = resume_fts.rowid "
+                    f"WHERE resume_fts MATCH ? AND resume_fts.rowid IN ({placeholders})",
+                    [query] + [row_id for row_id, _ in top]
+                )
+            }
+        results = []
+        for row_id, score in top:
+            resume_id, name, updated_at, snippet = details[row_id]
+            snippet = snippet.replace(FIELD_SEPARATOR + '\n', '').replace(FIELD_SEPARATOR, '')
+            results.append({'resume_id': resume_id, 'name': name, 'updated_at': updated_at,
+                            'score': -score, 'snippet': snippet})
+        return results
+
+    def get(self, resume_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM resumes WHERE resume_id = ?", (resume_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
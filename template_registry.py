@@ -0,0 +1,202 @@
+import json
+import os
+import re
+import threading
+import time
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Directory scanned for template files (*.json, and *.toml when a TOML parser is available)
+DEFAULT_TEMPLATES_DIR = os.environ.get(
+    "RESUME_TEMPLATES_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+)
+
+# Template schema: key -> (expected type(s), allowed values or None)
+COLOR_KEYS = ("primary", "secondary", "text", "accent")
+TEMPLATE_SCHEMA = {
+    "colors": (dict, None),
+    "font": (str, ("Helvetica", "Times", "Courier")),
+    "spacing": ((int, float), None),
+    "borders": (bool, None),
+    "header_style": (str, ("gradient", "bold", "professional")),
+    "section_style": (str, ("bordered", "modern", "boxed")),
+}
+OPTIONAL_KEYS = ("name", "description")
+HEX_COLOR = re.compile(r"^#[0-9a-fA-F]{6}$")
+
+
+class TemplateError(ValueError):
+    pass
+
+
+def hex_to_rgb(value):
+    value = value.lstrip('#')
+    return tuple(int(value[i:i+2], 16) for i in (0, 2, 4))
+
+
+def validate_template(raw, source="<template>"):
+    if not isinstance(raw, dict):
+        raise TemplateError(f"{source}: template must be a table/object")
+
+    unknown = set(raw) - set(TEMPLATE_SCHEMA) - set(OPTIONAL_KEYS)
+    if unknown:
+        raise TemplateError(f"{source}: unknown keys {sorted(unknown)}")
+
+    for key, (expected, allowed) in TEMPLATE_SCHEMA.items():
+        if key not in raw:
+            raise TemplateError(f"{source}: missing required key '{key}'")
+        value = raw[key]
+        # bool is a subclass of int, so don't accept it as a number
+        if not isinstance(value, expected) or (expected != bool and isinstance(value, bool)):
+            raise TemplateError(f"{source}: '{key}' has invalid type {type(value).__name__}")
+        if allowed is not None and value not in allowed:
+            raise TemplateError(f"{source}: '{key}' must be one of {list(allowed)}")
+
+    if not 0.8 <= raw["spacing"] <= 3:
+        raise TemplateError(f"{source}: 'spacing' must be between 0.8 and 3")
+
+    for key in COLOR_KEYS:
+        color = raw["colors"].get(key)
+        if not isinstance(color, str) or not HEX_COLOR.match(color):
+            raise TemplateError(f"{source}: colors.{key} must be a '#rrggbb' string")
+
+    if "name" in raw and (not isinstance(raw["name"], str) or not raw["name"].strip()):
+        raise TemplateError(f"{source}: 'name' must be a non-empty string")
+
+
+class TemplateStyle:
+    """Ready-to-render template with colors and sizes resolved up front."""
+
+    __slots__ = ("name", "description", "font", "primary", "secondary", "text", "accent",
+                 "spacing", "line_height", "entry_gap", "section_gap", "borders", "header_style",
+                 "section_style")
+
+    def __init__(self, name, raw):
+        self.name = name
+        self.description = raw.get("description", "")
+        self.font = raw["font"]
+        self.primary = hex_to_rgb(raw["colors"]["primary"])
+        self.secondary = hex_to_rgb(raw["colors"]["secondary"])
+        self.text = hex_to_rgb(raw["colors"]["text"])
+        self.accent = hex_to_rgb(raw["colors"]["accent"])
+        self.spacing = float(raw["spacing"])
+        # Line height and gaps (in mm) scale with the template spacing
+        self.line_height = round(5 * self.spacing, 2)
+        self.entry_gap = round(2 * self.spacing, 2)
+        self.section_gap = round(8 * self.spacing, 2)
+        self.borders = raw["borders"]
+        self.header_style = raw["header_style"]
+        self.section_style = raw["section_style"]
+
+
+def load_template_file(path):
+    if path.endswith(".toml"):
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compile_template(path):
+    source = os.path.basename(path)
+    try:
+        raw = load_template_file(path)
+    except (OSError, ValueError) as e:
+        raise TemplateError(f"{source}: {e}")
+    validate_template(raw, source)
+    name = raw.get("name") or os.path.splitext(source)[0].replace("_", " ").title()
+    return TemplateStyle(name, raw)
+
+
+class TemplateRegistry:
+    """Compiles template files once and recompiles only those whose mtime changed.
+
+    A single registry is meant to be shared by every session and render thread,
+    so all cache access goes through a lock. `errors` and the template table are
+    rebuilt and swapped in whole, never changed in place, so readers can iterate
+    them without the lock. A file that stops compiling keeps serving its last good
+    template until it parses again.
+    """
+
+    def __init__(self, directory=DEFAULT_TEMPLATES_DIR, check_interval=1.0):
+        self.directory = directory
+        # Minimum seconds between directory scans, so a burst of reruns costs one scan
+        self.check_interval = check_interval
+        self.errors = {}
+        self._lock = threading.Lock()
+        self._files = {}  # path -> (mtime_ns, last good TemplateStyle or None, error or None)
+        self._templates = {}
+        self._last_check = None
+
+    def _template_paths(self):
+        extensions = (".json", ".toml") if tomllib is not None else (".json",)
+        try:
+            names = sorted(os.listdir(self.directory))
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.directory, n) for n in names if n.endswith(extensions)]
+
+    def refresh(self, force=False):
+        """Pick up added, changed and removed template files. Returns True if anything changed."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._last_check is not None and now - self._last_check < self.check_interval:
+                return False
+            first_load = self._last_check is None
+            self._last_check = now
+            changed = False
+            seen = set()
+            for path in self._template_paths():
+                seen.add(path)
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except FileNotFoundError:
+                    continue
+                cached = self._files.get(path)
+                if cached is not None and cached[0] == mtime:
+                    continue
+                try:
+                    style, error = compile_template(path), None
+                except TemplateError as e:
+                    # Keep the last good version, e.g. while an editor is mid-save
+                    style, error = cached[1] if cached is not None else None, str(e)
+                self._files[path] = (mtime, style, error)
+                changed = True
+
+            for path in set(self._files) - seen:
+                del self._files[path]
+                changed = True
+
+            if changed or first_load:
+                templates = {}
+                errors = {}
+                for path, (_, style, error) in sorted(self._files.items()):
+                    if error is not None:
+                        errors[path] = f"{error} (using last valid version)" if style is not None else f"{error} (skipped)"
+                    if style is None:
+                        continue
+                    if style.name in templates:
+                        errors[path] = f"{os.path.basename(path)}: duplicate template name '{style.name}' (skipped)"
+                        continue
+                    templates[style.name] = style
+                self._templates = templates
+                self.errors = errors
+            return changed
+
+    def names(self):
+        self.refresh()
+        return list(self._templates.keys())
+
+    def get(self, name):
+        self.refresh()
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise TemplateError(f"Unknown template '{name}'")